@@ -5,12 +5,76 @@ Mock Redis Command Test
 Tests Redis commands using our mock client in a single session.
 """
 
+import hashlib
 import subprocess
-import tempfile
 import os
 
+try:
+    import zset_wrap    # built with `make zset_wrap`
+except ImportError:
+    zset_wrap = None
+
+OBJS = ['src/avl.o', 'src/hashtable.o', 'src/zset.o']
+CACHE_DIR = '.cache'
+
+def cached_build(source):
+    """Compile `source` against OBJS, reusing a previous build if unchanged."""
+    h = hashlib.blake2b(source.encode('utf-8'), digest_size=16)
+    for obj in OBJS:
+        with open(obj, 'rb') as f:
+            h.update(f.read())
+    exe = os.path.join(CACHE_DIR, f'redis_test_{h.hexdigest()}.exe')
+    if os.path.exists(exe):
+        print("Using cached Redis test build...")
+        return exe
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = exe + '.tmp'
+    compile_cmd = [
+        'g++', '-std=gnu++17', '-O2', '-fno-plt', '-pipe',
+        '-Wall', '-Wno-unused-variable', '-Iinclude',
+        '-x', 'c++', '-', '-x', 'none', *OBJS, '-o', tmp
+    ]
+    print("Compiling Redis test...")
+    result = subprocess.run(compile_cmd, input=source, capture_output=True, text=True, cwd='.')
+    if result.returncode != 0:
+        print(f"Compilation failed: {result.stderr}")
+        return None
+    os.replace(tmp, exe)
+    return exe
+
+def run_native_test():
+    """Run the same checks in-process through the zset_wrap extension."""
+    print("Running Redis command tests...")
+    zset = zset_wrap.SortedSet()
+
+    score = zset.lookup(b"n1")
+    print("Test 1 - zscore asdf n1: " + ("FAIL" if score is not None else "PASS (nil)"))
+
+    added = zset.insert(b"n1", 1.0)
+    print("Test 2 - zadd zset 1 n1: " + ("PASS (int) 1" if added else "FAIL"))
+
+    added = zset.insert(b"n2", 2.0)
+    print("Test 3 - zadd zset 2 n2: " + ("PASS (int) 1" if added else "FAIL"))
+
+    added = zset.insert(b"n1", 1.1)
+    print("Test 4 - zadd zset 1.1 n1 (update): " + ("PASS (int) 0" if not added else "FAIL"))
+
+    score = zset.lookup(b"n1")
+    print("Test 5 - zscore zset n1: " + ("PASS (dbl) 1.1" if score == 1.1 else "FAIL"))
+
+    print(f"Test 6 - Total members: {len(zset)} (expected: 2)")
+
+    print("Test 7 - Range query (score >= 1.0):")
+    for name, score in zset.seekge(1.0, b"", 5):
+        print(f"  Member: {name.decode()} (score: {score:g})")
+
+    print("\n=== All tests completed ===\n")
+
 def run_redis_test():
     print("=== Mock Redis Command Test ===")
+    if zset_wrap is not None:
+        return run_native_test()
     
     # Create a simple test script that tests our Redis functionality
     test_script = '''
@@ -74,40 +138,17 @@ int main() {
 }
 '''
     
-    # Write test to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as f:
-        f.write(test_script)
-        test_file = f.name
-    
-    try:
-        # Compile the test
-        compile_cmd = [
-            'g++', '-std=gnu++17', '-Wall', '-Wno-unused-variable', 
-            '-Iinclude', test_file, 'src/avl.o', 'src/hashtable.o', 'src/zset.o',
-            '-o', 'redis_test.exe'
-        ]
-        
-        print("Compiling Redis test...")
-        result = subprocess.run(compile_cmd, capture_output=True, text=True, cwd='.')
-        if result.returncode != 0:
-            print(f"Compilation failed: {result.stderr}")
-            return
-        
-        # Run the test
-        print("Running Redis command tests...")
-        result = subprocess.run(['./redis_test.exe'], capture_output=True, text=True, cwd='.')
-        print(result.stdout)
-        
-        if result.returncode != 0:
-            print(f"Test execution failed: {result.stderr}")
-        
-    finally:
-        # Clean up
-        try:
-            os.unlink(test_file)
-            os.unlink('redis_test.exe')
-        except:
-            pass
+    exe = cached_build(test_script)
+    if exe is None:
+        return
+
+    # Run the test
+    print("Running Redis command tests...")
+    result = subprocess.run([exe], capture_output=True, text=True, cwd='.')
+    print(result.stdout)
+
+    if result.returncode != 0:
+        print(f"Test execution failed: {result.stderr}")
 
 if __name__ == '__main__':
     run_redis_test()
@@ -0,0 +1,43 @@
+# cases.py
+"""
+Shared Redis Command Cases
+==========================
+
+The single table of command cases used by test_cmds.py, gen_cases.py and
+redis_test_summary.py. Each case is (command, expected output, description),
+where the command is the argument list passed to ./client and the expected
+output is exactly what ./client prints. The cases share one server and must
+run in order: later cases depend on the writes of earlier ones.
+
+CMDS, OUTPUTS and DESCRIPTIONS are the same table split into columns.
+"""
+
+CASES = (
+    ('zscore asdf n1', b'(nil)\n',
+     'Score lookup on non-existent key'),
+    ('zquery xxx 1 asdf 1 10', b'(arr) len=0\n(arr) end\n',
+     'Query on non-existent zset'),
+    ('zadd zset 1 n1', b'(int) 1\n',
+     'Add new member to zset'),
+    ('zadd zset 2 n2', b'(int) 1\n',
+     'Add another member to zset'),
+    ('zadd zset 1.1 n1', b'(int) 0\n',
+     'Update existing member score'),
+    ('zscore zset n1', b'(dbl) 1.1\n',
+     'Get updated score'),
+    ('zquery zset 1 "" 0 10',
+     b'(arr) len=4\n(str) n1\n(dbl) 1.1\n(str) n2\n(dbl) 2\n(arr) end\n',
+     'Range query from the lowest score'),
+    ('zquery zset 1.1 "" 1 10', b'(arr) len=2\n(str) n2\n(dbl) 2\n(arr) end\n',
+     'Range query with an offset'),
+    ('zquery zset 1.1 "" 2 10', b'(arr) len=0\n(arr) end\n',
+     'Range query past the last member'),
+    ('zrem zset adsf', b'(int) 0\n',
+     'Remove non-existent member'),
+    ('zrem zset n1', b'(int) 1\n',
+     'Remove existing member'),
+    ('zquery zset 1 "" 0 10', b'(arr) len=2\n(str) n2\n(dbl) 2\n(arr) end\n',
+     'Range query after removal'),
+)
+
+CMDS, OUTPUTS, DESCRIPTIONS = zip(*CASES)
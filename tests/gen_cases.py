@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Generate cases.tsv for run_cases.sh
+===================================
+
+Writes one `<command>\t<expected output>` line per case in cases.py, so CI
+can drive the cases with plain shell tools. Backslash, tab and newline in the
+expected output are escaped as \\, \t and \n, which `printf %b` undoes.
+
+Usage: python tests/gen_cases.py [output.tsv]
+"""
+
+import os
+import sys
+
+from cases import CASES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def escape(data):
+    return data.replace(b'\\', b'\\\\').replace(b'\t', b'\\t').replace(b'\n', b'\\n')
+
+def main(out_path=os.path.join(HERE, 'cases.tsv')):
+    lines = [b'./client ' + cmd.encode('utf-8') + b'\t' + escape(out) + b'\n'
+             for cmd, out, _ in CASES]
+    with open(out_path, 'wb') as f:
+        f.write(b''.join(lines))
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
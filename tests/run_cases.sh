@@ -0,0 +1,48 @@
+#!/bin/sh
+# run_cases.sh - run the command cases against a live server without Python.
+#
+# Usage: tests/run_cases.sh [cases.tsv]
+#
+# Generate the table once with `python tests/gen_cases.py`. Commands are run
+# from the current directory, like test_cmds.py does.
+#
+# The cases share one server, so writes run alone and in order; runs of
+# consecutive read-only cases are fanned out over $JOBS workers (default:
+# nproc) with xargs -P.
+
+CASES=${1:-$(dirname "$0")/cases.tsv}
+JOBS=${JOBS:-$(nproc)}
+
+# check one `<command>\t<expected>` line; exit 255 makes xargs stop early
+check='
+cmd=${1%%"	"*}
+expect=$(printf "%b" "${1#*"	"}")
+out=$(eval "$cmd") || exit 255
+[ "$out" = "$expect" ] && exit 0
+printf "cmd:%s out:%s expect:%s\n" "$cmd" "$out" "$expect" >&2
+exit 255
+'
+
+nl='
+'
+batch=
+
+flush() {
+    [ -n "$batch" ] || return 0
+    printf '%s' "$batch" | xargs -d '\n' -n 1 -P "$JOBS" sh -c "$check" sh || exit 1
+    batch=
+}
+
+set -f
+while IFS= read -r line; do
+    set -- ${line%%"	"*}
+    case $2 in
+    get|keys|pttl|zscore|zquery)
+        batch=$batch$line$nl
+        continue
+        ;;
+    esac
+    flush
+    sh -c "$check" sh "$line" || exit 1
+done < "$CASES"
+flush
@@ -17,74 +17,150 @@ Commands tested:
 - DEL: Delete keys
 - TTL operations: Time-to-live functionality
 
-The test cases are defined in a multi-line string format with expected
-input/output pairs that can be processed by a test runner.
-
-Format:
-$ ./client <command> <args>
-<expected_output>
+The test cases live in cases.py as (command, expected output, description)
+tuples shared with the other runners. By default all commands are pipelined
+over one connection to the server on port 1234; set USE_CLIENT=1 to run each
+one through ./client instead.
 
 Author: Custom Redis Project
 """
 
-CASES = r'''
-$ ./client zscore asdf n1
-(nil)
-$ ./client zquery xxx 1 asdf 1 10
-(arr) len=0
-(arr) end
-$ ./client zadd zset 1 n1
-(int) 1
-$ ./client zadd zset 2 n2
-(int) 1
-$ ./client zadd zset 1.1 n1
-(int) 0
-$ ./client zscore zset n1
-(dbl) 1.1
-$ ./client zquery zset 1 "" 0 10
-(arr) len=4
-(str) n1
-(dbl) 1.1
-(str) n2
-(dbl) 2
-(arr) end
-$ ./client zquery zset 1.1 "" 1 10
-(arr) len=2
-(str) n2
-(dbl) 2
-(arr) end
-$ ./client zquery zset 1.1 "" 2 10
-(arr) len=0
-(arr) end
-$ ./client zrem zset adsf
-(int) 0
-$ ./client zrem zset n1
-(int) 1
-$ ./client zquery zset 1 "" 0 10
-(arr) len=2
-(str) n2
-(dbl) 2
-(arr) end
-'''
-
-
+import os
 import shlex
+import socket
+import struct
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cases import CMDS, OUTPUTS
+
+cmds = ['./client ' + cmd for cmd in CMDS]
+outputs = OUTPUTS
+# tokenize once; cases quote empty args (""), so plain str.split() won't do
+argvs = [shlex.split(cmd) for cmd in cmds]
+
+# data types of serialized data, see src/14_server.cpp
+TAG_NIL, TAG_ERR, TAG_STR, TAG_INT, TAG_DBL, TAG_ARR = range(6)
+
+def encode_req(args):
+    # +------+-----+------+-----+------+-----+-----+------+
+    # | nstr | len | str1 | len | str2 | ... | len | strn |
+    # +------+-----+------+-----+------+-----+-----+------+
+    body = [struct.pack('<I', len(args))]
+    for arg in args:
+        arg = arg.encode('utf-8')
+        body.append(struct.pack('<I', len(arg)))
+        body.append(arg)
+    body = b''.join(body)
+    return struct.pack('<I', len(body)) + body
 
-cmds = []
-outputs = []
-lines = CASES.splitlines()
-for x in lines:
-    x = x.strip()
-    if not x:
-        continue
-    if x.startswith('$ '):
-        cmds.append(x[2:])
-        outputs.append('')
+def format_res(data, pos, buf):
+    # render one serialized value into `buf` the same way ./client prints it
+    tag = data[pos]
+    pos += 1
+    if tag == TAG_NIL:
+        buf += b'(nil)\n'
+    elif tag == TAG_ERR:
+        code, size = struct.unpack_from('<II', data, pos)
+        pos += 8
+        buf += b'(err) %d %s\n' % (code, data[pos:pos + size])
+        pos += size
+    elif tag == TAG_STR:
+        (size,) = struct.unpack_from('<I', data, pos)
+        pos += 4
+        buf += b'(str) %s\n' % data[pos:pos + size]
+        pos += size
+    elif tag == TAG_INT:
+        (val,) = struct.unpack_from('<q', data, pos)
+        buf += b'(int) %d\n' % val
+        pos += 8
+    elif tag == TAG_DBL:
+        (val,) = struct.unpack_from('<d', data, pos)
+        buf += b'(dbl) %g\n' % val
+        pos += 8
+    elif tag == TAG_ARR:
+        (n,) = struct.unpack_from('<I', data, pos)
+        pos += 4
+        buf += b'(arr) len=%d\n' % n
+        for _ in range(n):
+            pos = format_res(data, pos, buf)
+        buf += b'(arr) end\n'
     else:
-        outputs[-1] = outputs[-1] + x + '\n'
+        raise ValueError(f'bad response tag: {tag}')
+    return pos
+
+def run_pipelined(argvs, addr=('127.0.0.1', 1234)):
+    # send every request over one connection, then read the replies in order
+    reqs = b''.join(encode_req(argv[1:]) for argv in argvs)
+    with socket.create_connection(addr) as sock:
+        # write from another thread so a large batch can't deadlock
+        # against the server's outgoing buffer
+        writer = threading.Thread(target=sock.sendall, args=(reqs,))
+        writer.start()
+        rfile = sock.makefile('rb')
+        outs = []
+        for _ in argvs:
+            (size,) = struct.unpack('<I', rfile.read(4))
+            # bytearray appends are amortized O(1), unlike bytes concatenation
+            buf = bytearray()
+            format_res(rfile.read(size), 0, buf)
+            outs.append(bytes(buf))
+        writer.join()
+    return outs
+
+# The cases share one server, so a write must not overlap anything else.
+# Consecutive read-only cases are independent and can run concurrently.
+READONLY = {'get', 'keys', 'pttl', 'zscore', 'zquery'}
+
+def run(argv):
+    # posix_spawn avoids copying our page tables like fork()+exec() does;
+    # both pipe ends are close-on-exec, so only the dup'ed stdout leaks
+    rfd, wfd = os.pipe()
+    try:
+        pid = os.posix_spawn(argv[0], argv, os.environ,
+                             file_actions=[(os.POSIX_SPAWN_DUP2, wfd, 1)])
+    except OSError:
+        os.close(rfd)
+        raise
+    finally:
+        os.close(wfd)
+    # read the child's stdout straight off an unbuffered pipe
+    with open(rfd, 'rb', buffering=0) as f:
+        out = f.readall()
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    if code:
+        raise subprocess.CalledProcessError(code, argv, out)
+    return out
+
+def run_client(argvs):
+    # one ./client process per case
+    batches = []
+    for i, argv in enumerate(argvs):
+        readonly = argv[1] in READONLY
+        if readonly and batches and batches[-1][0]:
+            batches[-1][1].append(i)
+        else:
+            batches.append((readonly, [i]))
+
+    outs = []
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        for _, idx in batches:
+            outs.extend(pool.map(run, [argvs[i] for i in idx]))
+    return outs
+
+# set USE_CLIENT=1 to go through the ./client binary instead of the socket
+if os.environ.get('USE_CLIENT'):
+    results = run_client(argvs)
+else:
+    results = run_pipelined(argvs)
+
+def verify(cmd, expect, out):
+    # outputs are compared as bytes; only decode to report a failure
+    assert out == expect, (f"cmd:{cmd} "
+                           f"out:{out.decode('utf-8')} "
+                           f"expect:{expect.decode('utf-8')}")
+    return True
 
-assert len(cmds) == len(outputs)
-for cmd, expect in zip(cmds, outputs):
-    out = subprocess.check_output(shlex.split(cmd)).decode('utf-8')
-    assert out == expect, f'cmd:{cmd} out:{out} expect:{expect}'
+assert all(map(verify, cmds, outputs, results))
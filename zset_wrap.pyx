@@ -0,0 +1,66 @@
+# distutils: language = c++
+"""
+ZSet Python Bindings
+====================
+Thin Cython wrapper around the sorted set in src/zset.cpp, so tests can
+call zset_insert/zset_lookup/zset_seekge in-process instead of compiling
+and running a separate C++ program.
+
+Build with `make zset_wrap`.
+"""
+
+from libc.stdint cimport int64_t
+
+cdef extern from "zset.h":
+    cdef cppclass HMap:
+        pass
+
+    cdef cppclass ZSet:
+        HMap hmap
+
+    cdef cppclass ZNode:
+        double score
+        size_t len
+        char name[1]
+
+    bint zset_insert(ZSet *zset, const char *name, size_t len, double score)
+    ZNode *zset_lookup(ZSet *zset, const char *name, size_t len)
+    ZNode *zset_seekge(ZSet *zset, double score, const char *name, size_t len)
+    void zset_clear(ZSet *zset)
+    ZNode *znode_offset(ZNode *node, int64_t offset)
+    size_t hm_size(HMap *hmap)
+
+
+cdef class SortedSet:
+    """Owns one ZSet; names are bytes, scores are floats."""
+
+    cdef ZSet *zset
+
+    def __cinit__(self):
+        self.zset = new ZSet()
+
+    def __dealloc__(self):
+        if self.zset is not NULL:
+            zset_clear(self.zset)
+            del self.zset
+
+    def __len__(self):
+        return hm_size(&self.zset.hmap)
+
+    def insert(self, bytes name, double score):
+        """Add or update a member; True if it was newly added."""
+        return zset_insert(self.zset, name, len(name), score)
+
+    def lookup(self, bytes name):
+        """Return the member's score, or None if it does not exist."""
+        cdef ZNode *node = zset_lookup(self.zset, name, len(name))
+        return node.score if node is not NULL else None
+
+    def seekge(self, double score, bytes name=b'', Py_ssize_t limit=0):
+        """Return (name, score) pairs starting at the first (score, name) >= the given pair."""
+        cdef ZNode *node = zset_seekge(self.zset, score, name, len(name))
+        out = []
+        while node is not NULL and (limit == 0 or len(out) < limit):
+            out.append((node.name[:node.len], node.score))
+            node = znode_offset(node, 1)
+        return out